@@ -33,45 +33,50 @@ sys.path.insert(0, str(ROOT / "features"))
 
 # Configuration
 PROJECT_CODE = "PROJ"  # TODO: Change this to your project code
+HEADER_RE = re.compile(rf"^{re.escape(PROJECT_CODE)}\.(\d+):")
+# Same header as an extended regex for git log; re.escape follows Python's
+# rules (e.g. it emits "\-"), so escape only the characters special to git
+GIT_HEADER_PATTERN = (
+    "^" + re.sub(r"([.\[\]()*+?{}|^$\\])", r"\\\1", PROJECT_CODE) + r"\.[0-9]+:"
+)
 
 
 def cmd_spellcheck(args):
     """Handle spellcheck commands."""
-    cmd = [sys.executable, str(ROOT / "scripts" / "spellcheck.py")]
+    import spellcheck
 
-    if args.fix:
-        cmd.append("--fix")
-
-    try:
-        subprocess.run(cmd, check=True)
-        return 0
-    except subprocess.CalledProcessError as e:
-        return e.returncode
+    spellcheck.main(["--fix"] if args.fix else [])
+    return 0
 
 
 def get_next_commit_number():
-    """Scan git log for PROJECT.NNNN pattern and return next number."""
+    """Find the latest PROJECT.NNNN commit in git log and return next number."""
     try:
-        # Get last 100 commit subjects
+        # Let git find the most recent numbered commits. The message filter
+        # also matches body lines, so ask for a few and check subjects below
         output = subprocess.check_output(
-            ["git", "log", "-n", "100", "--pretty=format:%s"],
+            [
+                "git",
+                "log",
+                "-E",
+                "--grep",
+                GIT_HEADER_PATTERN,
+                "-n",
+                "10",
+                "--pretty=format:%s",
+            ],
             text=True,
             stderr=subprocess.DEVNULL,
         )
     except subprocess.CalledProcessError:
         return 1  # No commits yet
 
-    max_num = 0
-    pattern = re.compile(rf"{PROJECT_CODE}\.(\d+):")
-
     for line in output.splitlines():
-        match = pattern.match(line)
+        match = HEADER_RE.match(line)
         if match:
-            num = int(match.group(1))
-            if num > max_num:
-                max_num = num
+            return int(match.group(1)) + 1
 
-    return max_num + 1
+    return 1  # No numbered commits yet
 
 
 def cmd_git(args):
@@ -103,7 +108,8 @@ def cmd_git(args):
         print(f"Commit Message:\n{'-'*40}\n{full_msg}\n{'-'*40}")
 
         try:
-            # Stage all changes
+            # Stage all changes. `git commit -a` would save a process but
+            # skips untracked files, so new files would silently be left out
             print("Staging files...")
             subprocess.run(["git", "add", "."], check=True)
 
@@ -119,12 +125,12 @@ def cmd_git(args):
     if args.push:
         print(f"=== Push ===")
         try:
-            # Check if there are unpushed commits
-            status = subprocess.run(
-                ["git", "status", "-sb"], capture_output=True, text=True, check=True
-            ).stdout
+            # Count commits not yet on the upstream branch
+            ahead = subprocess.check_output(
+                ["git", "rev-list", "--count", "@{u}..HEAD"], text=True
+            ).strip()
 
-            if "ahead" not in status:
+            if int(ahead or 0) == 0:
                 print("Nothing to push.")
                 return 0
 
@@ -16,50 +16,73 @@ Output:
     spelling_errors.txt - List of potential spelling errors with file:line format
 """
 
+import io
+import os
 import re
 import ast
 import sys
 import tokenize
 import argparse
-from spellchecker import SpellChecker
+import functools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from spellchecker import SpellChecker
 
 # Configuration
-IGNORE_DIRS = {
-    ".git",
-    "__pycache__",
-    ".venv",
-    "venv",
-    "env",
-    "node_modules",
-    "data",
-    "logs",
-    "output",
-    "build",
-    "dist",
-}
-IGNORE_FILES = {"spelling_errors.txt"}  # Self-generated output
-IGNORE_EXTENSIONS = {
-    ".json",
-    ".csv",
-    ".pyc",
-    ".png",
-    ".jpg",
-    ".jpeg",
-    ".gif",
-    ".ico",
-    ".svg",
-    ".pdf",
-    ".zip",
-    ".tar",
-    ".gz",
-}
-CHECK_EXTENSIONS = {".py", ".md", ".txt"}
+IGNORE_DIRS = frozenset(
+    {
+        ".git",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "env",
+        "node_modules",
+        "data",
+        "logs",
+        "output",
+        "build",
+        "dist",
+    }
+)
+IGNORE_FILES = frozenset({"spelling_errors.txt"})  # Self-generated output
+IGNORE_EXTENSIONS = frozenset(
+    {
+        ".json",
+        ".csv",
+        ".pyc",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".ico",
+        ".svg",
+        ".pdf",
+        ".zip",
+        ".tar",
+        ".gz",
+    }
+)
+CHECK_EXTENSIONS = frozenset({".py", ".md", ".txt"})
+MAX_TEXT_FILE_BYTES = 1_000_000  # Larger text files are likely logs or dumps
+
+# Regex patterns compiled once and reused for every line and token
+_CLEAN_RE = re.compile(r"[^a-zA-Z\u00C0-\u00FF\s]")
+_HEX_RE = re.compile(r"^[a-f0-9]+$")
+_CAMEL_RE = re.compile(r"([a-z0-9])([A-Z])")
+_INLINE_CODE_RE = re.compile(r"`[^`]+`")
+_CODE_FENCE_RE = re.compile(r"^\s*```")
 
 # Dictionary file paths (relative to project root)
 GENERIC_DICT_PATH = Path("data/dictionaries/generic_dictionary.txt")
 PROJECT_DICT_PATH = Path("data/dictionaries/project_dictionary.txt")
 
+# (lowercased word, file path, line number, context, line content)
+WordOccurrence = tuple[str, Path, int, str, str]
+
 
 def load_dictionary(file_path: Path) -> set[str]:
     """
@@ -114,7 +137,7 @@ def add_to_dictionary(word: str, dictionary_path: Path) -> bool:
         return False
 
 
-def initialize_spellchecker() -> tuple[SpellChecker, set[str]]:
+def initialize_spellchecker() -> tuple["SpellChecker", set[str]]:
     """
     Initialize the spellchecker with generic and project dictionaries.
 
@@ -126,6 +149,9 @@ def initialize_spellchecker() -> tuple[SpellChecker, set[str]]:
         - Project dictionary is loaded second (can override/extend)
         - All custom words are added to the spellchecker
     """
+    # Imported here so that importing this module (e.g. from cli.py) stays cheap
+    from spellchecker import SpellChecker
+
     spell = SpellChecker()
 
     # Load dictionaries in order: generic first, then project-specific
@@ -145,13 +171,47 @@ def initialize_spellchecker() -> tuple[SpellChecker, set[str]]:
     return spell, all_custom_words
 
 
-# Initialize spellchecker with external dictionaries
-spell, CUSTOM_WORDS = initialize_spellchecker()
+@functools.lru_cache(maxsize=None)
+def _load_spellchecker() -> tuple["SpellChecker", set[str]]:
+    """Initialize the spellchecker on first use and cache the result."""
+    return initialize_spellchecker()
+
+
+def get_spell() -> "SpellChecker":
+    """Return the shared SpellChecker instance, loading dictionaries on first call."""
+    return _load_spellchecker()[0]
+
+
+def get_custom_words() -> set[str]:
+    """Return the shared set of custom dictionary words."""
+    return _load_spellchecker()[1]
+
+
+@functools.lru_cache(maxsize=None)
+def get_known_words() -> frozenset[str]:
+    """Return every word the spellchecker accepts, custom dictionaries included."""
+    return frozenset(map(sys.intern, get_spell().word_frequency.dictionary))
+
+
+@functools.lru_cache(maxsize=None)
+def suggest(word: str) -> tuple[str, ...]:
+    """
+    Return up to five spelling suggestions for a word.
+
+    Candidates are pyspellchecker's closest matches, most common word first.
+    """
+    spell = get_spell()
+    frequency = spell.word_frequency.dictionary
+    candidates = spell.candidates(word) or set()
+    ranked = sorted(
+        candidates, key=lambda candidate: (-frequency[candidate], candidate)
+    )
+    return tuple(ranked[:5])
 
 
 def split_camel_case(text: str) -> list[str]:
     """Split camelCase text into individual words."""
-    return re.sub("([a-z0-9])([A-Z])", r"\1 \2", text).split()
+    return _CAMEL_RE.sub(r"\1 \2", text).split()
 
 
 def split_snake_case(text: str) -> list[str]:
@@ -171,7 +231,7 @@ def extract_words(text: str) -> list[str]:
     """
     # Remove non-alphabetic characters but keep spaces
     # Allow accented characters for Pokémon
-    clean_text = re.sub(r"[^a-zA-Z\u00C0-\u00FF\s]", " ", text)
+    clean_text = _CLEAN_RE.sub(" ", text)
     words = []
     for token in clean_text.split():
         # Handle camelCase and snake_case
@@ -187,6 +247,16 @@ def extract_words(text: str) -> list[str]:
 class SpellingError:
     """Represents a spelling error with context for fixing."""
 
+    # Large projects can produce many errors; avoid a per-instance __dict__
+    __slots__ = (
+        "word",
+        "file_path",
+        "line_num",
+        "context",
+        "line_content",
+        "_suggestions",
+    )
+
     def __init__(
         self,
         word: str,
@@ -200,17 +270,41 @@ class SpellingError:
         self.line_num = line_num
         self.context = context
         self.line_content = line_content
-        self.suggestions = list(spell.candidates(word) or [])[:5]
+        self._suggestions: tuple[str, ...] | None = None
+
+    @property
+    def suggestions(self) -> tuple[str, ...]:
+        """Spelling suggestions, computed on first access (only needed by --fix)."""
+        if self._suggestions is None:
+            self._suggestions = suggest(self.word)
+        return self._suggestions
 
     def __str__(self) -> str:
         return f"{self.file_path}:{self.line_num} - '{self.word}' (Context: {self.context})"
 
 
-def check_text_detailed(
-    text: str, file_path: Path, line_num: int, context: str = "", line_content: str = ""
-) -> list[SpellingError]:
+def _lowercase_words(text: str) -> tuple[str, ...]:
+    """Return the distinct lowercased words of text, interned for fast lookup."""
+    return tuple(
+        dict.fromkeys(sys.intern(word.lower()) for word in extract_words(text))
+    )
+
+
+# Identifiers and file stems such as self, path or __init__ recur in almost
+# every file; free text (lines, comments, docstrings) rarely repeats
+_lowercase_name_words = functools.lru_cache(maxsize=50000)(_lowercase_words)
+
+
+def extract_occurrences(
+    text: str,
+    file_path: Path,
+    line_num: int,
+    context: str = "",
+    line_content: str = "",
+    is_name: bool = False,
+) -> list[WordOccurrence]:
     """
-    Check text for spelling errors with detailed information.
+    Extract the words to check from text, without consulting the spellchecker.
 
     Args:
         text: Text to check
@@ -218,38 +312,144 @@ def check_text_detailed(
         line_num: Line number
         context: Description of where the text came from
         line_content: The full line content for display
+        is_name: True for identifiers and file names, whose words are cached
 
     Returns:
-        List of SpellingError objects
+        List of word occurrences, one per distinct lowercased word in text
+    """
+    words = _lowercase_name_words(text) if is_name else _lowercase_words(text)
+    return [(word, file_path, line_num, context, line_content) for word in words]
+
+
+def find_unknown_words(words: set[str]) -> set[str]:
     """
-    words = extract_words(text)
-    unknown = spell.unknown(words)
-    errors = []
+    Find which of the given lowercased words are misspelled.
+
+    Args:
+        words: Distinct lowercased words collected from the project
 
-    for word in unknown:
-        # Double check if it's really unknown (case insensitive)
-        if word.lower() in CUSTOM_WORDS or word.lower() in spell:
+    Returns:
+        Subset of words not known to the spellchecker or custom dictionaries
+    """
+    # Custom words are loaded into the spellchecker, so one lookup covers both
+    known = get_known_words()
+    # Same cap as pyspellchecker's unknown(): longer tokens are not words
+    max_length = get_spell().word_frequency.longest_word_length + 3
+    unknown = set()
+
+    for word in words:
+        if word in known or len(word) > max_length:
             continue
         # Ignore if it looks like a hex code or random string
-        if re.match(r"^[a-f0-9]+$", word.lower()):
+        if _HEX_RE.match(word):
             continue
+        unknown.add(word)
 
-        errors.append(SpellingError(word, file_path, line_num, context, line_content))
+    return unknown
 
-    return errors
 
+def build_errors(occurrences: list[WordOccurrence]) -> list[SpellingError]:
+    """
+    Turn word occurrences into spelling errors using one batched lookup.
 
-def process_python_file_detailed(file_path: Path) -> list[SpellingError]:
+    Args:
+        occurrences: Word occurrences collected from all checked files
+
+    Returns:
+        List of SpellingError objects, in occurrence order
+
+    Postconditions:
+        - The spellchecker is queried once per distinct word
+        - No suggestions are computed yet; see SpellingError.suggestions
+    """
+    unknown = find_unknown_words({occurrence[0] for occurrence in occurrences})
+
+    return [
+        SpellingError(*occurrence)
+        for occurrence in occurrences
+        if occurrence[0] in unknown
+    ]
+
+
+class _Visitor(ast.NodeVisitor):
     """
-    Process a Python file for spelling errors with detailed information.
+    Collect word occurrences from docstrings, definition names and assignments.
+
+    Each identifier is checked only at its first definition or assignment
+    in the file, since names like self or path repeat many times.
+    """
+
+    def __init__(self, file_path: Path, get_line: Callable[[int], str]):
+        self.file_path = file_path
+        self.get_line = get_line
+        self.occurrences: list[WordOccurrence] = []
+        self.seen_names: set[str] = set()
+
+    def _add(
+        self, text: str, line_num: int, context: str, is_name: bool = False
+    ) -> None:
+        self.occurrences.extend(
+            extract_occurrences(
+                text,
+                self.file_path,
+                line_num,
+                context,
+                self.get_line(line_num),
+                is_name,
+            )
+        )
+
+    def _check_docstring(
+        self, node: ast.Module | ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+    ) -> None:
+        docstring = ast.get_docstring(node)
+        if docstring:
+            self._add(docstring, getattr(node, "lineno", 1), "Docstring")
+
+    def visit_Module(self, node: ast.Module) -> None:
+        self._check_docstring(node)
+        self.generic_visit(node)
+
+    def _check_name(self, name: str, line_num: int, context: str) -> None:
+        if name in self.seen_names:
+            return
+        self.seen_names.add(name)
+        self._add(name, line_num, context, is_name=True)
+
+    def _visit_def(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+    ) -> None:
+        self._check_docstring(node)
+        self._check_name(node.name, node.lineno, "Definition Name")
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._visit_def(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._visit_def(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self._visit_def(node)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                self._check_name(target.id, node.lineno, "Variable Name")
+        self.generic_visit(node)
+
+
+def process_python_file_detailed(file_path: Path) -> list[WordOccurrence]:
+    """
+    Collect the words to spellcheck from a Python file.
 
     Args:
         file_path: Path to the Python file
 
     Returns:
-        List of SpellingError objects
+        List of word occurrences
     """
-    errors = []
+    occurrences = []
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -261,161 +461,149 @@ def process_python_file_detailed(file_path: Path) -> list[SpellingError]:
                 return lines[n - 1]
             return ""
 
-        # Check file name
-        errors.extend(check_text_detailed(file_path.stem, file_path, 0, "Filename"))
-
         # Parse AST for docstrings and identifiers
         try:
             tree = ast.parse(content)
-            for node in ast.walk(tree):
-                # Check docstrings
-                if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Module)):
-                    docstring = ast.get_docstring(node)
-                    if docstring:
-                        lineno = getattr(node, "lineno", 1)
-                        errors.extend(
-                            check_text_detailed(
-                                docstring,
-                                file_path,
-                                lineno,
-                                "Docstring",
-                                get_line(lineno),
-                            )
-                        )
-
-                # Check function/class names
-                if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                    errors.extend(
-                        check_text_detailed(
-                            node.name,
-                            file_path,
-                            node.lineno,
-                            "Definition Name",
-                            get_line(node.lineno),
-                        )
-                    )
-
-                # Check variable assignments (targets)
-                if isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name):
-                            errors.extend(
-                                check_text_detailed(
-                                    target.id,
-                                    file_path,
-                                    node.lineno,
-                                    "Variable Name",
-                                    get_line(node.lineno),
-                                )
-                            )
+            visitor = _Visitor(file_path, get_line)
+            visitor.visit(tree)
+            occurrences.extend(visitor.occurrences)
         except SyntaxError:
             pass  # Ignore syntax errors in parsing
 
-        # Check comments using tokenize
-        with open(file_path, "rb") as f:
-            try:
-                tokens = tokenize.tokenize(f.readline)
-                for token in tokens:
-                    if token.type == tokenize.COMMENT:
-                        errors.extend(
-                            check_text_detailed(
-                                token.string,
-                                file_path,
-                                token.start[0],
-                                "Comment",
-                                get_line(token.start[0]),
-                            )
+        # Check comments using tokenize on the already-read content
+        try:
+            tokens = tokenize.generate_tokens(io.StringIO(content).readline)
+            for token in tokens:
+                if token.type == tokenize.COMMENT:
+                    occurrences.extend(
+                        extract_occurrences(
+                            token.string,
+                            file_path,
+                            token.start[0],
+                            "Comment",
+                            get_line(token.start[0]),
                         )
-            except tokenize.TokenizeError:
-                pass  # Ignore tokenize errors
+                    )
+        except (tokenize.TokenError, SyntaxError):
+            pass  # Ignore tokenize errors
 
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
 
-    return errors
+    return occurrences
 
 
-def process_text_file_detailed(file_path: Path) -> list[SpellingError]:
+def process_text_file_detailed(file_path: Path) -> list[WordOccurrence]:
     """
-    Process a text file (.md, .txt) for spelling errors with detailed information.
+    Collect the words to spellcheck from a text file (.md, .txt).
 
     Args:
         file_path: Path to the text file
 
     Returns:
-        List of SpellingError objects
+        List of word occurrences
     """
-    errors = []
+    occurrences: list[WordOccurrence] = []
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        # Check file name
-        errors.extend(check_text_detailed(file_path.stem, file_path, 0, "Filename"))
+        if file_path.stat().st_size > MAX_TEXT_FILE_BYTES:
+            print(f"Skipping {file_path} (larger than {MAX_TEXT_FILE_BYTES} bytes)")
+            return occurrences
 
+        is_markdown = file_path.suffix == ".md"
         in_code_block = False
-        for i, line in enumerate(lines):
-            original_line = line
-            # Track code blocks in markdown
-            if file_path.suffix == ".md":
-                if line.strip().startswith("```"):
-                    in_code_block = not in_code_block
-                    continue
-                if in_code_block:
-                    continue
-                # Skip inline code
-                if "`" in line:
-                    # Remove inline code segments before checking
-                    line = re.sub(r"`[^`]+`", "", line)
-
-            errors.extend(
-                check_text_detailed(
-                    line, file_path, i + 1, "Text Content", original_line.rstrip()
+        with open(file_path, "r", encoding="utf-8") as f:
+            for i, line in enumerate(f, 1):
+                original_line = line
+                # Track code blocks in markdown
+                if is_markdown:
+                    if _CODE_FENCE_RE.match(line):
+                        in_code_block = not in_code_block
+                        continue
+                    if in_code_block:
+                        continue
+                    # Skip inline code
+                    if "`" in line:
+                        # Remove inline code segments before checking
+                        line = _INLINE_CODE_RE.sub("", line)
+
+                occurrences.extend(
+                    extract_occurrences(
+                        line, file_path, i, "Text Content", original_line.rstrip()
+                    )
                 )
-            )
 
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
 
-    return errors
+    return occurrences
+
 
+@functools.lru_cache(maxsize=None)
+def _word_pattern(word: str) -> re.Pattern:
+    """Return a cached case-insensitive pattern matching word literally."""
+    return re.compile(re.escape(word), re.IGNORECASE)
 
-def fix_in_file(file_path: Path, old_word: str, new_word: str, line_num: int) -> bool:
+
+def fix_in_file(
+    file_path: Path,
+    old_word: str,
+    new_word: str,
+    line_num: int,
+    pending_edits: dict[Path, list[tuple[int, str, str]]],
+) -> bool:
     """
-    Replace a word in a file at a specific line.
+    Queue replacement of a word in a file at a specific line.
+
+    The file is not touched until _flush_edits runs, so fixing many errors
+    in one file rewrites it only once.
 
     Args:
         file_path: Path to the file
         old_word: Word to replace
         new_word: Replacement word
         line_num: Line number (1-indexed, 0 means filename - skip)
+        pending_edits: Queued edits per file, updated in place
 
     Returns:
-        True if successful, False otherwise
+        True if the edit was queued, False otherwise
     """
     if line_num == 0:
         print("  Cannot fix filenames automatically. Please rename manually.")
         return False
 
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+    pending_edits.setdefault(file_path, []).append((line_num, old_word, new_word))
+    return True
+
 
-        if 0 < line_num <= len(lines):
-            # Case-insensitive replacement, preserving case of first letter
-            pattern = re.compile(re.escape(old_word), re.IGNORECASE)
-            lines[line_num - 1] = pattern.sub(new_word, lines[line_num - 1], count=1)
+def _flush_edits(pending_edits: dict[Path, list[tuple[int, str, str]]]) -> None:
+    """
+    Apply queued edits, reading and writing each file once.
+
+    Args:
+        pending_edits: Queued edits per file; emptied once applied
+    """
+    for file_path, edits in pending_edits.items():
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+
+            for line_num, old_word, new_word in edits:
+                if 0 < line_num <= len(lines):
+                    # Case-insensitive replacement, preserving case of first letter
+                    pattern = _word_pattern(old_word)
+                    lines[line_num - 1] = pattern.sub(
+                        new_word, lines[line_num - 1], count=1
+                    )
+                else:
+                    print(f"  Line {line_num} out of range for {file_path}")
 
             with open(file_path, "w", encoding="utf-8") as f:
                 f.writelines(lines)
-            return True
-        else:
-            print(f"  Line {line_num} out of range for {file_path}")
-            return False
 
-    except Exception as e:
-        print(f"  Error fixing: {e}")
-        return False
+        except Exception as e:
+            print(f"  Error fixing {file_path}: {e}")
+
+    pending_edits.clear()
 
 
 def interactive_fix(errors: list[SpellingError]) -> dict:
@@ -442,105 +630,186 @@ def interactive_fix(errors: list[SpellingError]) -> dict:
     print("  [q]   Quit interactive mode")
     print("=" * 60 + "\n")
 
-    for i, error in enumerate(errors):
-        if stats["quit"]:
-            break
+    pending_edits: dict[Path, list[tuple[int, str, str]]] = {}
+    try:
+        for i, error in enumerate(errors):
+            if stats["quit"]:
+                break
 
-        print(f"\n[{i+1}/{len(errors)}] {error.file_path}:{error.line_num}")
-        print(f"  Context: {error.context}")
-        if error.line_content:
-            # Highlight the misspelled word
-            highlighted = error.line_content.replace(
-                error.word, f"\033[91m{error.word}\033[0m"
-            )
-            print(f"  Line: {highlighted}")
-        print(f"\n  Misspelled: '\033[93m{error.word}\033[0m'")
+            print(f"\n[{i+1}/{len(errors)}] {error.file_path}:{error.line_num}")
+            print(f"  Context: {error.context}")
+            if error.line_content:
+                # Highlight the misspelled word
+                highlighted = error.line_content.replace(
+                    error.word, f"\033[91m{error.word}\033[0m"
+                )
+                print(f"  Line: {highlighted}")
+            print(f"\n  Misspelled: '\033[93m{error.word}\033[0m'")
 
-        if error.suggestions:
-            print(f"  Suggestions:")
-            for j, suggestion in enumerate(error.suggestions, 1):
-                print(f"    [{j}] {suggestion}")
-        else:
-            print("  No suggestions available")
+            if error.suggestions:
+                print(f"  Suggestions:")
+                for j, suggestion in enumerate(error.suggestions, 1):
+                    print(f"    [{j}] {suggestion}")
+            else:
+                print("  No suggestions available")
 
-        while True:
-            choice = input("\n  Action [1-5/m/g/p/s/q]: ").strip().lower()
+            while True:
+                choice = input("\n  Action [1-5/m/g/p/s/q]: ").strip().lower()
 
-            if choice == "q":
-                stats["quit"] = True
-                print("\n  Quitting interactive mode...")
-                break
+                if choice == "q":
+                    stats["quit"] = True
+                    print("\n  Quitting interactive mode...")
+                    break
 
-            elif choice == "s":
-                stats["skipped"] += 1
-                print("  Skipped.")
-                break
+                elif choice == "s":
+                    stats["skipped"] += 1
+                    print("  Skipped.")
+                    break
 
-            elif choice == "g":
-                if add_to_dictionary(error.word, GENERIC_DICT_PATH):
-                    CUSTOM_WORDS.add(error.word.lower())
-                    stats["added_to_dict"] += 1
-                    print(f"  Added '{error.word}' to generic dictionary.")
-                break
+                elif choice == "g":
+                    if add_to_dictionary(error.word, GENERIC_DICT_PATH):
+                        get_custom_words().add(error.word.lower())
+                        stats["added_to_dict"] += 1
+                        print(f"  Added '{error.word}' to generic dictionary.")
+                    break
 
-            elif choice == "p":
-                if add_to_dictionary(error.word, PROJECT_DICT_PATH):
-                    CUSTOM_WORDS.add(error.word.lower())
-                    stats["added_to_dict"] += 1
-                    print(f"  Added '{error.word}' to project dictionary.")
-                break
+                elif choice == "p":
+                    if add_to_dictionary(error.word, PROJECT_DICT_PATH):
+                        get_custom_words().add(error.word.lower())
+                        stats["added_to_dict"] += 1
+                        print(f"  Added '{error.word}' to project dictionary.")
+                    break
 
-            elif choice == "m":
-                new_word = input("  Enter correction: ").strip()
-                if new_word:
+                elif choice == "m":
+                    new_word = input("  Enter correction: ").strip()
+                    if new_word:
+                        if fix_in_file(
+                            error.file_path,
+                            error.word,
+                            new_word,
+                            error.line_num,
+                            pending_edits,
+                        ):
+                            stats["fixed"] += 1
+                            print(f"  Fixed: '{error.word}' -> '{new_word}'")
+                        break
+                    else:
+                        print("  No correction entered.")
+
+                elif choice.isdigit() and 1 <= int(choice) <= len(error.suggestions):
+                    idx = int(choice) - 1
+                    new_word = error.suggestions[idx]
                     if fix_in_file(
-                        error.file_path, error.word, new_word, error.line_num
+                        error.file_path,
+                        error.word,
+                        new_word,
+                        error.line_num,
+                        pending_edits,
                     ):
                         stats["fixed"] += 1
                         print(f"  Fixed: '{error.word}' -> '{new_word}'")
                     break
-                else:
-                    print("  No correction entered.")
-
-            elif choice.isdigit() and 1 <= int(choice) <= len(error.suggestions):
-                idx = int(choice) - 1
-                new_word = error.suggestions[idx]
-                if fix_in_file(error.file_path, error.word, new_word, error.line_num):
-                    stats["fixed"] += 1
-                    print(f"  Fixed: '{error.word}' -> '{new_word}'")
-                break
 
-            else:
-                print("  Invalid choice. Please try again.")
+                else:
+                    print("  Invalid choice. Please try again.")
+    finally:
+        # Write all queued fixes, even if the session is interrupted
+        _flush_edits(pending_edits)
 
     return stats
 
 
-def collect_all_errors() -> list[SpellingError]:
-    """Collect all spelling errors from the project."""
-    root_dir = Path(".")
-    all_errors = []
+def _walk(root: str) -> Iterator[str]:
+    """
+    Yield paths of files to check under root.
 
-    for file_path in root_dir.rglob("*"):
-        # Skip ignored directories
-        if any(part in IGNORE_DIRS for part in file_path.parts):
-            continue
+    Ignored directories are pruned before descending, so their contents
+    are never listed.
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORE_DIRS:
+                        yield from _walk(entry.path)
+                elif (
+                    entry.is_file()
+                    and entry.name not in IGNORE_FILES
+                    and os.path.splitext(entry.name)[1] in CHECK_EXTENSIONS
+                ):
+                    yield entry.path
+    except OSError:
+        pass  # Ignore unreadable directories
+
+
+# Known words in a worker process, set by _init_worker
+_worker_known_words: frozenset[str] = frozenset()
+
+
+def _init_worker(known_words: frozenset[str]) -> None:
+    """Give a worker process the known words so it can drop them early."""
+    global _worker_known_words
+    _worker_known_words = known_words
+
+
+def _process_one(path: str) -> list[WordOccurrence]:
+    """Collect possibly misspelled word occurrences from a single file."""
+    file_path = Path(path)
+    if file_path.suffix == ".py":
+        occurrences = process_python_file_detailed(file_path)
+    else:
+        occurrences = process_text_file_detailed(file_path)
+
+    # Most words are spelled correctly; drop them before sending results back
+    return [
+        occurrence
+        for occurrence in occurrences
+        if occurrence[0] not in _worker_known_words
+    ]
 
-        # Skip ignored files
-        if file_path.name in IGNORE_FILES:
-            continue
 
-        if file_path.is_file() and file_path.suffix in CHECK_EXTENSIONS:
+def collect_all_errors() -> list[SpellingError]:
+    """Collect all spelling errors from the project."""
+    files = list(_walk("."))
+    occurrences = []
+    chunk_size = 16
+    # Each worker takes whole chunks, so more workers than chunks sit idle
+    max_workers = min(os.cpu_count() or 1, -(-len(files) // chunk_size))
+
+    with contextlib.ExitStack() as stack:
+        results: Iterable[list[WordOccurrence]]
+        if max_workers > 1:
+            # Files are independent, so extract words in parallel. Workers only
+            # get the known-words set; the spellchecker itself stays here
+            pool = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(get_known_words(),),
+                )
+            )
+            results = pool.map(_process_one, files, chunksize=chunk_size)
+        else:
+            # Too few files to be worth starting worker processes
+            _init_worker(get_known_words())
+            results = map(_process_one, files)
+
+        for path, file_occurrences in zip(files, results):
+            file_path = Path(path)
             print(f"Checking {file_path}...")
-            if file_path.suffix == ".py":
-                all_errors.extend(process_python_file_detailed(file_path))
-            else:
-                all_errors.extend(process_text_file_detailed(file_path))
+            # File names are checked here so that stems shared by many files
+            # (__init__, README) hit the word cache of a single process
+            occurrences.extend(
+                extract_occurrences(
+                    file_path.stem, file_path, 0, "Filename", is_name=True
+                )
+            )
+            occurrences.extend(file_occurrences)
 
-    return all_errors
+    return build_errors(occurrences)
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Main entry point for the spellcheck linter."""
     parser = argparse.ArgumentParser(
         description="Spellcheck linter with optional interactive fix mode."
@@ -548,11 +817,11 @@ def main():
     parser.add_argument(
         "--fix", action="store_true", help="Run in interactive fix mode"
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     print("Starting spell check...")
-    print(f"Checking extensions: {CHECK_EXTENSIONS}")
-    print(f"Ignoring directories: {IGNORE_DIRS}")
+    print(f"Checking extensions: {', '.join(sorted(CHECK_EXTENSIONS))}")
+    print(f"Ignoring directories: {', '.join(sorted(IGNORE_DIRS))}")
     print()
 
     all_errors = collect_all_errors()
@@ -580,8 +849,8 @@ def main():
     else:
         # Report mode - write errors to file
         with open("spelling_errors.txt", "w", encoding="utf-8") as f:
-            for error in all_errors:
-                f.write(str(error) + "\n")
+            f.write("\n".join(map(str, all_errors)))
+            f.write("\n")
 
         print("See spelling_errors.txt for details.")
         print("\nRun with --fix for interactive correction mode.")
@@ -0,0 +1,97 @@
+"""
+Unit tests for scripts/spellcheck.py.
+
+Tests the batched fix-mode edits (fix_in_file, _flush_edits, interactive_fix)
+against temporary files.
+"""
+
+import io
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import spellcheck  # noqa: E402
+
+
+class TestFlushEdits(unittest.TestCase):
+    """Tests for fix_in_file() and _flush_edits()."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = Path(self.tmp_dir.name) / "notes.txt"
+        self.file_path.write_text("Ths wrold\nA wrold of wrold\n", encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_flush_edits_with_several_edits_writes_file_once(self):
+        """Verify queued edits, two on one line, are applied in order in one write."""
+        # Arrange
+        pending_edits = {}
+        spellcheck.fix_in_file(self.file_path, "ths", "This", 1, pending_edits)
+        spellcheck.fix_in_file(self.file_path, "wrold", "world", 2, pending_edits)
+        spellcheck.fix_in_file(self.file_path, "wrold", "word", 2, pending_edits)
+
+        # Act
+        with patch("spellcheck.open", side_effect=open, create=True) as mock_open:
+            spellcheck._flush_edits(pending_edits)
+
+        # Assert
+        writes = [c for c in mock_open.call_args_list if c.args[1] == "w"]
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(
+            self.file_path.read_text(encoding="utf-8"),
+            "This wrold\nA world of word\n",
+        )
+        self.assertEqual(pending_edits, {})
+
+    def test_flush_edits_with_out_of_range_line_reports_it(self):
+        """Verify an edit past the end of the file is reported and skipped."""
+        # Arrange
+        pending_edits = {}
+        spellcheck.fix_in_file(self.file_path, "wrold", "world", 9, pending_edits)
+        output = io.StringIO()
+
+        # Act
+        with redirect_stdout(output):
+            spellcheck._flush_edits(pending_edits)
+
+        # Assert
+        self.assertIn("Line 9 out of range", output.getvalue())
+        self.assertEqual(
+            self.file_path.read_text(encoding="utf-8"),
+            "Ths wrold\nA wrold of wrold\n",
+        )
+
+    def test_interactive_fix_on_quit_flushes_queued_edits(self):
+        """Verify fixes made before quitting are written to the file."""
+        # Arrange
+        errors = [
+            spellcheck.SpellingError("wrold", self.file_path, 1, "Text Content"),
+            spellcheck.SpellingError("wrold", self.file_path, 2, "Text Content"),
+        ]
+        answers = ["m", "world", "q"]
+
+        # Act
+        with patch("builtins.input", side_effect=answers), patch(
+            "spellcheck.suggest", return_value=()
+        ), redirect_stdout(io.StringIO()):
+            stats = spellcheck.interactive_fix(errors)
+
+        # Assert
+        self.assertTrue(stats["quit"])
+        self.assertEqual(stats["fixed"], 1)
+        self.assertEqual(
+            self.file_path.read_text(encoding="utf-8"),
+            "Ths world\nA wrold of wrold\n",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()